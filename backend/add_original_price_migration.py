@@ -18,9 +18,18 @@ def migrate_database():
     
     # Connect to database
     conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=268435456")
+    conn.execute("PRAGMA busy_timeout=5000")
+    # Manage the transaction explicitly so the whole migration is one write lock and one fsync
+    conn.isolation_level = None
     cursor = conn.cursor()
     
     try:
+        cursor.execute("BEGIN IMMEDIATE")
+        
         # Check if original_price column exists in products table
         cursor.execute("PRAGMA table_info(products)")
         columns = [column[1] for column in cursor.fetchall()]
@@ -43,6 +52,13 @@ def migrate_database():
         else:
             print("original_price column already exists in price_history table")
         
+        # Composite index for the per-product history query
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS ix_ph_pid_checked "
+            "ON price_history (product_id, checked_at DESC)"
+        )
+        print("✓ Ensured ix_ph_pid_checked index on price_history table")
+        
         # Commit changes
         conn.commit()
         print("✓ Migration completed successfully!")
@@ -1,14 +1,21 @@
 from fastapi import FastAPI, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, ForeignKey
+from fastapi.responses import ORJSONResponse
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
+from fastapi_cache.coder import PickleCoder
+from fastapi_cache.decorator import cache
+from sqlalchemy import event, select, insert, update, delete, Column, Integer, String, Float, DateTime, ForeignKey, Index
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session, relationship
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from datetime import datetime
+from typing import List, Optional
 from pydantic import BaseModel
-from scraper import PaulSmithScraper
+from scraper import PaulSmithScraper, BatchScraper
 import uvicorn
 
-app = FastAPI(title="Price Tracker", version="1.0.0")
+app = FastAPI(title="Price Tracker", version="1.0.0", default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -18,9 +25,30 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-SQLALCHEMY_DATABASE_URL = "sqlite:///./price_tracker.db"
-engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SQLALCHEMY_DATABASE_URL = "sqlite+aiosqlite:///./price_tracker.db"
+# aiosqlite defaults to NullPool, which opens a fresh connection (and thread) per session;
+# keep connections pooled so each request reuses one with its PRAGMAs already applied
+engine = create_async_engine(
+    SQLALCHEMY_DATABASE_URL,
+    connect_args={"timeout": 30},
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=20,
+    max_overflow=10
+)
+
+# PRAGMAs are per connection, so they're applied as each pooled connection opens
+@event.listens_for(engine.sync_engine, "connect")
+def _pragma(dbapi_conn, _):
+    # WAL lets readers run alongside the writer; NORMAL sync is safe under WAL
+    cursor = dbapi_conn.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.execute("PRAGMA busy_timeout=5000")
+    cursor.close()
+
+SessionLocal = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
 Base = declarative_base()
 
 class Product(Base):
@@ -43,57 +71,87 @@ class PriceHistory(Base):
     original_price = Column(Float)  # Original price if different from sale
     checked_at = Column(DateTime, default=datetime.utcnow)
 
-Base.metadata.create_all(bind=engine)
+# Serves the per-product history query, including its ORDER BY, straight from the index
+Index("ix_ph_pid_checked", PriceHistory.product_id, PriceHistory.checked_at.desc())
+
+# Read endpoints are cached per URL; every write clears this namespace
+CACHE_NAMESPACE = "products"
+
+def request_key_builder(func, namespace="", request=None, response=None, args=None, kwargs=None):
+    # Key on the URL only; the injected DB session differs on every request
+    return f"{FastAPICache.get_prefix()}:{namespace}:{request.url.path}?{request.url.query}"
 
 # Global scraper instance for browser reuse
 scraper = PaulSmithScraper()
+# Single-product scrapes from concurrent requests are grouped into shared batches
+batcher = BatchScraper(scraper)
 
-# Cleanup function for graceful shutdown
-import atexit
-import asyncio
+@app.on_event("startup")
+async def init_db():
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    # Pickle round-trips the row dicts exactly (JsonCoder would revive datetimes as tz-aware)
+    FastAPICache.init(InMemoryBackend(), prefix="price-tracker", coder=PickleCoder, key_builder=request_key_builder)
 
-def cleanup_scraper():
-    try:
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            # Schedule cleanup for later if loop is running
-            loop.create_task(scraper.close())
-        else:
-            # Run cleanup directly if no loop is running
-            asyncio.run(scraper.close())
-    except:
-        pass  # Ignore cleanup errors
+@app.on_event("startup")
+async def start_scraper():
+    # Launch Chromium once so the first scrape doesn't pay the cold start
+    await scraper._ensure_browser()
 
-atexit.register(cleanup_scraper)
+@app.on_event("shutdown")
+async def stop_scraper():
+    await batcher.close()
+    await scraper.close()
+    await engine.dispose()
 
 class ProductCreate(BaseModel):
     url: str
 
-def get_db():
-    db = SessionLocal()
-    try:
+class ProductOut(BaseModel):
+    id: int
+    url: str
+    name: Optional[str]
+    current_price: Optional[float]
+    original_price: Optional[float]
+    currency: Optional[str]
+    created_at: Optional[datetime]
+
+class PriceHistoryOut(BaseModel):
+    id: int
+    product_id: int
+    price: Optional[float]
+    original_price: Optional[float]
+    checked_at: Optional[datetime]
+
+async def get_db():
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 @app.get("/")
 async def root():
     return {"message": "Price Tracker API"}
 
-@app.get("/products")
-async def get_products(db: Session = Depends(get_db)):
-    products = db.query(Product).order_by(Product.created_at.desc()).all()
-    return products
+@app.get("/products", response_model=List[ProductOut])
+@cache(expire=30, namespace=CACHE_NAMESPACE)
+async def get_products(db: AsyncSession = Depends(get_db)):
+    # Select plain columns so rows skip ORM instance construction and the identity map
+    rows = (await db.execute(
+        select(
+            Product.id, Product.url, Product.name, Product.current_price,
+            Product.original_price, Product.currency, Product.created_at
+        ).order_by(Product.created_at.desc())
+    )).all()
+    return [row._asdict() for row in rows]
 
 @app.post("/products")
-async def add_product(product: ProductCreate, db: Session = Depends(get_db)):
+async def add_product(product: ProductCreate, db: AsyncSession = Depends(get_db)):
     # Check if product already exists
-    existing = db.query(Product).filter(Product.url == product.url).first()
+    existing = await db.scalar(select(Product).where(Product.url == product.url))
     if existing:
         raise HTTPException(status_code=400, detail="Product already being tracked")
     
     # Scrape product info
-    product_data = await scraper.scrape_product(product.url)
+    product_data = await batcher.scrape(product.url)
     if not product_data:
         raise HTTPException(status_code=400, detail="Could not scrape product information")
     
@@ -109,29 +167,29 @@ async def add_product(product: ProductCreate, db: Session = Depends(get_db)):
         currency=product_data.get("currency", "GBP")
     )
     db.add(db_product)
-    db.commit()
-    db.refresh(db_product)
+    await db.flush()  # Assigns db_product.id without committing
     
-    # Add initial price history
+    # Add initial price history in the same transaction
     price_record = PriceHistory(
         product_id=db_product.id,
         price=product_data["price"],
         original_price=product_data.get("original_price")
     )
     db.add(price_record)
-    db.commit()
+    await db.commit()
+    await FastAPICache.clear(namespace=CACHE_NAMESPACE)
     
     return db_product
 
 @app.post("/products/{product_id}/check-price")
-async def check_price(product_id: int, db: Session = Depends(get_db)):
+async def check_price(product_id: int, db: AsyncSession = Depends(get_db)):
     # Get product
-    product = db.query(Product).filter(Product.id == product_id).first()
+    product = await db.get(Product, product_id)
     if not product:
         raise HTTPException(status_code=404, detail="Product not found")
     
     # Scrape current price
-    product_data = await scraper.scrape_product(product.url)
+    product_data = await batcher.scrape(product.url)
     if not product_data:
         raise HTTPException(status_code=400, detail="Could not check price")
     
@@ -143,16 +201,16 @@ async def check_price(product_id: int, db: Session = Depends(get_db)):
     product.current_price = new_price
     product.original_price = product_data.get("original_price")
     product.currency = product_data.get("currency", product.currency)
-    db.commit()
     
-    # Add to price history
+    # Add to price history and commit both changes together
     price_record = PriceHistory(
         product_id=product_id,
         price=new_price,
         original_price=product_data.get("original_price")
     )
     db.add(price_record)
-    db.commit()
+    await db.commit()
+    await FastAPICache.clear(namespace=CACHE_NAMESPACE)
     
     return {
         "product_id": product_id, 
@@ -162,26 +220,78 @@ async def check_price(product_id: int, db: Session = Depends(get_db)):
         "currency": product.currency
     }
 
+@app.post("/products/check-all")
+async def check_all_prices(db: AsyncSession = Depends(get_db)):
+    products = (await db.scalars(select(Product))).all()
+    
+    # Scrape every product concurrently in the shared browser
+    results = await scraper.scrape_many([product.url for product in products])
+    
+    product_rows = []
+    history_rows = []
+    updated = []
+    failed = []
+    for product, product_data in zip(products, results):
+        if not product_data or product_data.get("price") is None:
+            failed.append(product.id)
+            continue
+        
+        currency = product_data.get("currency", product.currency)
+        product_rows.append({
+            "id": product.id,
+            "current_price": product_data["price"],
+            "original_price": product_data.get("original_price"),
+            "currency": currency
+        })
+        history_rows.append({
+            "product_id": product.id,
+            "price": product_data["price"],
+            "original_price": product_data.get("original_price")
+        })
+        updated.append({
+            "product_id": product.id,
+            "new_price": product_data["price"],
+            "original_price": product_data.get("original_price"),
+            "name": product.name,
+            "currency": currency
+        })
+    
+    # One executemany per table, committed as a single transaction
+    if product_rows:
+        await db.execute(update(Product), product_rows)
+        await db.execute(insert(PriceHistory), history_rows)
+        await db.commit()
+        await FastAPICache.clear(namespace=CACHE_NAMESPACE)
+    
+    return {"updated": updated, "failed": failed}
+
 @app.delete("/products/{product_id}")
-async def delete_product(product_id: int, db: Session = Depends(get_db)):
+async def delete_product(product_id: int, db: AsyncSession = Depends(get_db)):
     # Get product
-    product = db.query(Product).filter(Product.id == product_id).first()
+    product = await db.get(Product, product_id)
     if not product:
         raise HTTPException(status_code=404, detail="Product not found")
     
     # Delete price history first (due to foreign key constraint)
-    db.query(PriceHistory).filter(PriceHistory.product_id == product_id).delete()
+    await db.execute(delete(PriceHistory).where(PriceHistory.product_id == product_id))
     
     # Delete product
-    db.delete(product)
-    db.commit()
+    await db.delete(product)
+    await db.commit()
+    await FastAPICache.clear(namespace=CACHE_NAMESPACE)
     
     return {"message": "Product deleted successfully"}
 
-@app.get("/products/{product_id}/history")
-async def get_price_history(product_id: int, db: Session = Depends(get_db)):
-    history = db.query(PriceHistory).filter(PriceHistory.product_id == product_id).order_by(PriceHistory.checked_at.desc()).all()
-    return history
+@app.get("/products/{product_id}/history", response_model=List[PriceHistoryOut])
+@cache(expire=30, namespace=CACHE_NAMESPACE)
+async def get_price_history(product_id: int, db: AsyncSession = Depends(get_db)):
+    rows = (await db.execute(
+        select(
+            PriceHistory.id, PriceHistory.product_id, PriceHistory.price,
+            PriceHistory.original_price, PriceHistory.checked_at
+        ).where(PriceHistory.product_id == product_id).order_by(PriceHistory.checked_at.desc())
+    )).all()
+    return [row._asdict() for row in rows]
 
 if __name__ == "__main__":
     uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
@@ -14,9 +14,18 @@ def migrate_database():
         return
     
     conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=268435456")
+    conn.execute("PRAGMA busy_timeout=5000")
+    # Manage the transaction explicitly so the whole migration is one write lock and one fsync
+    conn.isolation_level = None
     cursor = conn.cursor()
     
     try:
+        cursor.execute("BEGIN IMMEDIATE")
+        
         # Check if currency column already exists
         cursor.execute("PRAGMA table_info(products)")
         columns = [column[1] for column in cursor.fetchall()]
@@ -28,11 +37,11 @@ def migrate_database():
             # Update existing products with USD currency if they have prices > 0
             # (since we know from testing that US store shows USD prices)
             cursor.execute("UPDATE products SET currency = 'USD' WHERE current_price > 0")
-            
-            conn.commit()
             print("✅ Currency column added successfully")
         else:
             print("✅ Currency column already exists")
+        
+        conn.commit()
             
     except Exception as e:
         print(f"❌ Migration failed: {e}")
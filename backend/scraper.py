@@ -1,148 +1,586 @@
-from playwright.async_api import async_playwright
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
+from selectolax.parser import HTMLParser
+import httpx
+import orjson
+import asyncio
+import json
 import re
 import logging
-from typing import Optional, Dict
+import os
+import shutil
+import tempfile
+from collections import Counter
+from functools import lru_cache
+from itertools import islice
+from typing import Optional, Dict, List, Tuple
+from urllib.parse import urlsplit
+
+try:
+    # Optional: RE2 scans the page HTML in guaranteed linear time; the stdlib engine is the fallback
+    import re2 as _html_re
+except ImportError:
+    _html_re = re
+
+__all__ = ["PaulSmithScraper", "BatchScraper"]
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+_USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36"
+_HEADERS = {
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.5",
+    "Referer": "https://www.google.com/"
+}
+
+# Price patterns are compiled once at import rather than per scrape. Digits are spelled [0-9]:
+# \d would match every Unicode decimal digit, and re.ASCII would also stop \s matching the
+# non-breaking spaces shops put between symbol and amount
+_PRICE = r'[£$€][0-9]{1,3}(?:,[0-9]{3})*\.?[0-9]{0,2}'
+
+# The page HTML is swept once for price hits and strikethrough tags; each text fallback
+# then checks only the short stretch of text around a hit for its keywords.
+# Prices plus opening/closing <del>/<s> tags to mark struck-through ones; \b keeps <span>, <script> etc. out
+_PRICE_TOKEN_RE = _html_re.compile(rf'(?i)(?P<price>{_PRICE})|<(?P<close>/?)(?:del|s)\b[^>]*>')
+_PRICE_KEYWORD_RE = re.compile(r'price|cost', re.IGNORECASE)
+_SALE_BEFORE_RE = re.compile(r'sale|now|discounted?|reduced?|special|offer', re.IGNORECASE)
+_SALE_AFTER_RE = re.compile(r'sale|now|discounted?|reduced?', re.IGNORECASE)
+_ORIGINAL_KEYWORD_RE = re.compile(r'was|originally|before|regular|rrp', re.IGNORECASE)
+
+# One number pattern for extract_price: 1,234.56 / European 123,45 / 123.45 or 123
+_PRICE_NUM = r'(?P<num>[0-9]{1,3}(?:,[0-9]{3})+(?:\.[0-9]+)?|[0-9]+,[0-9]{2}(?![0-9])|[0-9]+(?:\.[0-9]+)?)'
+_SYMBOL_PRICE_RE = re.compile(r'(?P<sym>[£$€])\s*' + _PRICE_NUM)
+_PRICE_COMBINED = re.compile(_PRICE_NUM)
+
+# JSON-LD blocks are pulled out with a regex so pages that have them are never parsed as HTML
+_JSONLD_RE = re.compile(r'<script[^>]+application/ld\+json[^>]*>(.*?)</script>', re.IGNORECASE | re.DOTALL)
+
+# Candidate selectors, most specific/common first, built once at import. They stay lists
+# (not tuples) because page.evaluate only serializes lists as JS arrays
+_NAME_SELECTORS = [
+    "h1",  # Start with most common first
+    "h1[data-testid='pdp-product-title']",
+    ".pdp-product-title",
+    "h1.pdp-title",
+    ".product-title h1",
+    ".product-name h1"
+]
+_SALE_SELECTORS = [
+    ".sale-price", ".current-price", ".discounted-price", ".final-price",
+    ".price-sale", ".price-current", ".price-now", ".price-final",
+    "[data-testid='sale-price']", "[data-testid='current-price']",
+    ".price.sale", ".price.current", ".price.discounted",
+    ".product-price-sale", ".product-price-current",
+    "span[class*='sale-price']", "span[class*='current-price']",
+    "div[class*='sale-price']", "div[class*='current-price']"
+]
+# Crossed out, struck through, etc.
+_ORIG_SELECTORS = [
+    ".original-price", ".was-price", ".strike-through", ".crossed-out",
+    ".price-was", ".price-original", ".price-before", ".regular-price",
+    "[data-testid='original-price']", "[data-testid='was-price']",
+    ".price.original", ".price.was", ".price.before",
+    "span[class*='original-price']", "span[class*='was-price']",
+    "div[class*='original-price']", "div[class*='was-price']",
+    "del", "s", ".strikethrough", "[style*='text-decoration: line-through']"
+]
+_PRICE_SELECTORS = [
+    ".price", ".current-price", ".product-price", 
+    "[data-testid='price']", "span[class*='price']",
+    ".price-current", ".price-now"
+]
+# Any product title, for the page-ready check
+_NAME_SELECTOR_ANY = ", ".join(_NAME_SELECTORS)
+
+# Runs all selector probing in the page and returns {name, sale, original, fallback, jsonLd} in
+# one round trip; selectors are tried in priority order, prices must carry a currency symbol. Each
+# field comes back with the selector that matched it, so the scraper can try it first next time
+_EXTRACT_DOM_JS = r"""([nameSelectors, saleSelectors, originalSelectors, priceSelectors]) => {
+    const firstText = (selectors) => {
+        for (const selector of selectors) {
+            const el = document.querySelector(selector);
+            const text = el && el.innerText.trim();
+            if (text) return [text, selector];
+        }
+        return [null, null];
+    };
+    const firstPrice = (selectors, perSelector) => {
+        for (const selector of selectors) {
+            for (const el of Array.from(document.querySelectorAll(selector)).slice(0, perSelector)) {
+                const text = el.innerText;
+                if (text && /[£$€]/.test(text)) return [text.trim(), selector];
+            }
+        }
+        return [null, null];
+    };
+    const [name, nameSelector] = firstText(nameSelectors);
+    const [sale, saleSelector] = firstPrice(saleSelectors, 2);
+    const [original, originalSelector] = firstPrice(originalSelectors, 2);
+    return {
+        name, nameSelector,
+        sale, saleSelector,
+        original, originalSelector,
+        fallback: firstPrice(priceSelectors, 3)[0],
+        jsonLd: Array.from(document.querySelectorAll('script[type="application/ld+json"]'), el => el.textContent)
+    };
+}"""
+
+_CURRENCY_BY_SYMBOL = {'£': 'GBP', '$': 'USD', '€': 'EUR'}
+_HAS_CUR = re.compile(r'[£$€]').search
+
+# Price markup as server-rendered or client-rendered, for the page-ready check and price-block serialization
+_HTML_PRICE_SELECTOR = "[data-testid*='price'], [class*='price']"
+
+# Both a title and price markup must exist before the DOM probe has anything to read
+_PAGE_READY_JS = (
+    f"() => !!(document.querySelector({json.dumps(_NAME_SELECTOR_ANY)})"
+    f" && document.querySelector({json.dumps(_HTML_PRICE_SELECTOR)}))"
+)
+
+# Returns the outerHTML of the outermost price blocks; a product's sale and was prices, with
+# their keywords and <del> tags, sit together in one block
+_PRICE_BLOCKS_JS = r"""([selector, limit]) => Array.from(document.querySelectorAll(selector))
+    .filter(el => !(el.parentElement && el.parentElement.closest(selector)))
+    .slice(0, limit)
+    .map(el => el.outerHTML)"""
+
+_MAX_PRICE_BLOCKS = 32
+
+# Returns the first `limit` currency-prefixed prices in the visible page text, e.g. ["£140.00", "$313.00"]
+_PAGE_PRICES_JS = r"""(limit) => {
+    const text = document.body ? document.body.innerText : '';
+    const pattern = /[£$€]\s*\d+(?:,\d{3})*(?:\.\d{1,2})?/g;
+    const found = [];
+    let match;
+    while (found.length < limit && (match = pattern.exec(text))) found.push(match[0]);
+    return found;
+}"""
+
+# The product's own prices come first on the page; later ones are recommendations and footers
+_MAX_PAGE_PRICES = 16
+
+# Only the DOM text is read, so images, styling and trackers are never needed
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet", "websocket"})
+_BLOCKED_HOSTS = (
+    "google-analytics.com", "googletagmanager.com", "doubleclick.net",
+    "facebook.net", "hotjar.com", "clarity.ms", "bing.com"
+)
+
+async def _block_heavy_resources(route):
+    request = route.request
+    host = urlsplit(request.url).hostname or ""
+    if request.resource_type in _BLOCKED_RESOURCE_TYPES or host.endswith(_BLOCKED_HOSTS):
+        await route.abort()
+    else:
+        await route.continue_()
+
+def _price_hits(html: str) -> Tuple[List[int], List[int], List[str], List[float], List[bool]]:
+    """Sweep the HTML for prices once, returned as parallel lists of starts, ends, texts, values
+    and whether each sits inside a <del> or <s> tag"""
+    starts, ends, texts, values, struck = [], [], [], [], []
+    in_strike = False
+    for match in _PRICE_TOKEN_RE.finditer(html):
+        text = match.group("price")
+        if text is None:
+            in_strike = not match.group("close")
+            continue
+        starts.append(match.start())
+        ends.append(match.end())
+        texts.append(text)
+        values.append(float(text[1:].replace(',', '')))
+        struck.append(in_strike)
+    return starts, ends, texts, values, struck
+
+def _first_hit_with_keyword(keyword_re, html: str, texts: List[str], lows: List[int], highs: List[int],
+                            exclude: Optional[str] = None) -> Optional[str]:
+    """Return the first hit other than `exclude` whose [low, high) stretch of HTML contains the keyword"""
+    for text, low, high in zip(texts, lows, highs):
+        if text != exclude and keyword_re.search(html, low, high):
+            return text
+    return None
+
+def _keyword_in_text(keyword_re, html: str, low: int, high: int) -> bool:
+    """Whether the keyword occurs in [low, high) of the HTML outside tag markup, so class="price" doesn't count"""
+    for match in keyword_re.finditer(html, low, high):
+        if html.rfind('<', 0, match.start()) <= html.rfind('>', 0, match.start()):
+            return True
+    return False
+
+def _winner_first(winner: Optional[str], selectors: List[str]) -> List[str]:
+    """Move the selector that matched on the last scrape to the front of the list"""
+    if not winner:
+        return selectors
+    return [winner] + [selector for selector in selectors if selector != winner]
+
+def _find_json_ld_product(data) -> Optional[dict]:
+    """Return the first schema.org Product node in a JSON-LD document"""
+    if isinstance(data, list):
+        for item in data:
+            product = _find_json_ld_product(item)
+            if product:
+                return product
+        return None
+    if not isinstance(data, dict):
+        return None
+    
+    types = data.get("@type")
+    if types == "Product" or (isinstance(types, list) and "Product" in types):
+        return data
+    return _find_json_ld_product(data.get("@graph"))
+
+def _product_from_json_ld(data) -> Optional[Dict[str, str]]:
+    """Build a scrape result from JSON-LD, or None if name or price is missing"""
+    product = _find_json_ld_product(data)
+    if not product or not product.get("name"):
+        return None
+    
+    offers = product.get("offers") or {}
+    if isinstance(offers, list):
+        offers = offers[0] if offers else {}
+    if not isinstance(offers, dict):
+        return None
+    
+    try:
+        price = float(offers.get("price", offers.get("lowPrice")))
+    except (TypeError, ValueError):
+        return None
+    
+    # A strikethrough/list price in priceSpecification is the pre-sale price
+    original_price = None
+    specs = offers.get("priceSpecification") or []
+    for spec in specs if isinstance(specs, list) else [specs]:
+        if isinstance(spec, dict) and str(spec.get("priceType", "")).endswith(("StrikethroughPrice", "ListPrice")):
+            try:
+                original_price = float(spec.get("price"))
+            except (TypeError, ValueError):
+                pass
+            break
+    if original_price is not None and original_price <= price:
+        original_price = None
+    
+    return {
+        "name": str(product["name"]).strip(),
+        "price": price,
+        "original_price": original_price,
+        "currency": offers.get("priceCurrency") or "GBP"
+    }
+
+def _first_json_ld_product(blocks) -> Optional[Dict[str, str]]:
+    """Build a scrape result from the first raw JSON-LD block that describes a product"""
+    for block in blocks:
+        try:
+            data = orjson.loads(block)
+        except orjson.JSONDecodeError:
+            continue
+        result = _product_from_json_ld(data)
+        if result:
+            return result
+    return None
+
+def _fill_original_price(result: Dict[str, str], original_price: Optional[float]) -> Dict[str, str]:
+    """Take the markup's original price for a JSON-LD result that has none; offers.price is the
+    sale price, and the pre-sale price is often only in the struck-through markup"""
+    if result["original_price"] is None and original_price and original_price > result["price"]:
+        result["original_price"] = original_price
+    return result
+
+def _parse_number(price_str: str) -> float:
+    """Convert a matched price number, e.g. 1,234.56 or European 123,45, to a float"""
+    if ',' in price_str and '.' not in price_str and len(price_str.rsplit(',', 1)[1]) == 2:
+        # European comma decimal separator
+        return float(price_str.replace(',', '.'))
+    # Remove comma thousands separators
+    return float(price_str.replace(',', ''))
+
+def _first_html_price(tree: HTMLParser, selectors: List[str], per_selector: int) -> Optional[Tuple[float, str]]:
+    """Return the first plausible currency price under the selectors, tried in priority order"""
+    for selector in selectors:
+        for node in islice(tree.css(selector), per_selector):
+            # Only the node's leading price counts, not an instalment or "save £X" amount after it
+            match = _SYMBOL_PRICE_RE.search(node.text(separator=" "))
+            if match:
+                price = _parse_number(match.group("num"))
+                # Rules out £0.00 basket totals; no upper bound, so items over £1000 keep the fast path
+                if price >= 1:
+                    return price, _CURRENCY_BY_SYMBOL[match.group("sym")]
+    return None
+
+def _product_from_html(tree: HTMLParser) -> Optional[Dict[str, str]]:
+    """Build a scrape result from server-rendered markup, or None if name or price is missing"""
+    name = None
+    for selector in _NAME_SELECTORS:
+        node = tree.css_first(selector)
+        name = node.text(strip=True) if node is not None else None
+        if name:
+            break
+    if not name:
+        return None
+    
+    # The same selector lists and priority order as the browser path's in-page probe
+    sale = _first_html_price(tree, _SALE_SELECTORS, 2) or _first_html_price(tree, _PRICE_SELECTORS, 3)
+    original = _first_html_price(tree, _ORIG_SELECTORS, 2)
+    if not sale:
+        sale, original = original, None
+    if not sale:
+        return None
+    
+    price, currency = sale
+    return {
+        "name": name,
+        "price": price,
+        "original_price": original[0] if original and original[0] > price else None,
+        "currency": currency
+    }
+
+@lru_cache(maxsize=1024)
+def _is_domain_url(url: str, domain: str) -> bool:
+    # Only the host counts, so the domain in a path or query is rejected; batch refreshes repeat URLs
+    try:
+        host = urlsplit(url).hostname or ""
+    except ValueError:
+        return False
+    return host == domain or host.endswith("." + domain)
+
 class PaulSmithScraper:
-    def __init__(self):
+    def __init__(self, max_concurrency: int = 5, user_data_dir: Optional[str] = None):
         self.base_domain = "paulsmith.com"
-        self.browser = None
+        self.playwright = None
         self.context = None
+        # Chromium profile whose HTTP and V8 code caches stay warm across relaunches. A profile can only
+        # be open in one process, so the default is per-process; PS_SCRAPER_PROFILE_DIR keeps one between runs
+        self.user_data_dir = user_data_dir or os.environ.get("PS_SCRAPER_PROFILE_DIR")
+        self._owns_profile = not self.user_data_dir
+        if self._owns_profile:
+            self.user_data_dir = os.path.join(tempfile.gettempdir(), f"ps-scraper-profile-{os.getpid()}")
+        self._http = None
+        self._browser_lock = asyncio.Lock()
+        # Pre-opened pages shared by concurrent scrapes; its size bounds concurrency
+        self._max_concurrency = max_concurrency
+        self._page_pool = None
+        # Product pages share one template, so the selectors that matched last time usually match again
+        self._winning_name_selector = None
+        self._winning_sale_selector = None
+        self._winning_orig_selector = None
     
     def is_valid_url(self, url: str) -> bool:
         """Check if URL is from Paul Smith website"""
-        return self.base_domain in url.lower()
+        return _is_domain_url(url, self.base_domain)
     
     async def _ensure_browser(self):
         """Ensure browser is running and ready"""
-        if self.browser is None or not self.browser.is_connected():
-            from playwright.async_api import async_playwright
-            self.playwright = await async_playwright().start()
-            self.browser = await self.playwright.chromium.launch(
-                headless=True,
-                args=[
-                    '--no-sandbox',
-                    '--disable-dev-shm-usage',
-                    '--disable-web-security',
-                    '--disable-features=VizDisplayCompositor',
-                    '--disable-background-timer-throttling',
-                    '--disable-renderer-backgrounding',
-                    '--disable-backgrounding-occluded-windows'
-                ]
-            )
-            self.context = await self.browser.new_context(
-                user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
-                extra_http_headers={
-                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-                    "Accept-Language": "en-US,en;q=0.5",
-                    "Referer": "https://www.google.com/"
-                }
+        async with self._browser_lock:
+            if self.context is None:
+                # A context that closed on its own leaves its driver process running
+                await self._stop_playwright()
+                self.playwright = await async_playwright().start()
+                context = None
+                try:
+                    context = await self.playwright.chromium.launch_persistent_context(
+                        self.user_data_dir,
+                        headless=True,
+                        args=[
+                            '--no-sandbox',
+                            '--disable-dev-shm-usage',
+                            '--disable-web-security',
+                            '--disable-features=VizDisplayCompositor',
+                            '--disable-background-timer-throttling',
+                            '--disable-renderer-backgrounding',
+                            '--disable-backgrounding-occluded-windows'
+                        ],
+                        user_agent=_USER_AGENT,
+                        extra_http_headers=_HEADERS,
+                        java_script_enabled=True,
+                        bypass_csp=True
+                    )
+                    # Registered once on the context so every page inherits it
+                    await context.route("**/*", _block_heavy_resources)
+                    pool = asyncio.Queue()
+                    for _ in range(self._max_concurrency):
+                        pool.put_nowait(await context.new_page())
+                except Exception:
+                    # Publish nothing half-built, so the next scrape retries a clean launch
+                    if context is not None:
+                        try:
+                            await context.close()
+                        except Exception:
+                            pass
+                    await self._stop_playwright()
+                    raise
+                
+                # Fires if Chromium exits too, so the next scrape relaunches it
+                context.on("close", self._on_context_close)
+                self.context = context
+                self._page_pool = pool
+
+    async def _stop_playwright(self):
+        playwright, self.playwright = self.playwright, None
+        if playwright is not None:
+            try:
+                await playwright.stop()
+            except Exception as e:
+                logger.warning("Could not stop Playwright: %s", e)
+
+    def _on_context_close(self, context):
+        if self.context is context:
+            self.context = None
+            self._retire_pool()
+
+    def _retire_pool(self):
+        # A None sentinel wakes scrapes still waiting on this context's pages so they fail instead of hanging
+        if self._page_pool is not None:
+            self._page_pool.put_nowait(None)
+            self._page_pool = None
+
+    async def _acquire_page(self):
+        """Check out a pooled page, returned with the pool it must go back to"""
+        pool = self._page_pool
+        if pool is None:
+            raise RuntimeError("Browser closed before a page could be checked out")
+        page = await pool.get()
+        if page is None:
+            pool.put_nowait(None)  # Pass the wake-up on to the next waiter
+            raise RuntimeError("Browser closed while waiting for a page")
+        return page, pool
+
+    async def _release_page(self, page, pool):
+        """Reset a pooled page and return it to its pool, replacing it if it can't be reused"""
+        # Pages of a closed context are dead, and a relaunched browser has its own full pool
+        if pool is not self._page_pool:
+            return
+        try:
+            await page.goto("about:blank")
+        except Exception as e:
+            logger.warning("Replacing pooled page: %s", e)
+            try:
+                await page.close()
+            except Exception:
+                pass
+            try:
+                page = await self.context.new_page()
+            except Exception as replace_error:
+                logger.warning("Could not replace pooled page: %s", replace_error)
+                return
+        # The context may have closed while the page was being reset
+        if pool is self._page_pool:
+            pool.put_nowait(page)
+
+    async def _fast_scrape(self, url: str) -> Optional[Dict[str, str]]:
+        """Fast path: read name and price from the page's JSON-LD or static HTML without a browser"""
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                http2=True,
+                headers={"User-Agent": _USER_AGENT, **_HEADERS},
+                follow_redirects=True,
+                timeout=10,
+                # Bounded pool whose connections all stay alive between batch refreshes
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=32)
             )
+        
+        try:
+            response = await self._http.get(url)
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            logger.info("Fast path fetch failed for %s: %s", url, e)
+            return None
+        
+        html = response.text
+        result = _first_json_ld_product(match.group(1) for match in _JSONLD_RE.finditer(html))
+        if result:
+            if result["original_price"] is None:
+                # Only parse the markup when the structured data lacks the was-price
+                original = _first_html_price(HTMLParser(html), _ORIG_SELECTORS, 2)
+                _fill_original_price(result, original[0] if original else None)
+            logger.info("Scraping result (JSON-LD): %s", result)
+            return result
+        
+        # No structured data; product pages server-render the title and price block too
+        result = _product_from_html(HTMLParser(html))
+        if result:
+            logger.info("Scraping result (HTML): %s", result)
+        return result
 
     async def scrape_product(self, url: str) -> Optional[Dict[str, str]]:
         """Scrape product name and price from Paul Smith URL"""
         if not self.is_valid_url(url):
-            logger.warning(f"Invalid URL: {url}")
+            logger.warning("Invalid URL: %s", url)
             return None
-            
+        
+        page = None
         try:
+            # Most product pages are readable over plain HTTP; only fall back to Chromium when they aren't
+            result = await self._fast_scrape(url)
+            if result:
+                return result
+            
             await self._ensure_browser()
-            page = await self.context.new_page()
+            page, pool = await self._acquire_page()
             
-            logger.info(f"Navigating to: {url}")
-            # Optimize page load - don't wait for all network activity
-            await page.goto(url, wait_until="domcontentloaded", timeout=15000)
+            logger.info("Navigating to: %s", url)
+            # Return at the first response byte; the ready check below is the real gate
+            await page.goto(url, wait_until="commit", timeout=15000)
             
-            # Quick check for page load completion
+            # One wait for the title and price, resolving as soon as both stream in or render client-side
             try:
-                await page.wait_for_selector("h1", timeout=5000)
-            except:
-                logger.warning("Page might not be fully loaded, continuing anyway")
+                await page.wait_for_function(_PAGE_READY_JS, timeout=5000)
+            except PlaywrightTimeoutError:
+                logger.warning("Page might not be fully loaded, continuing with fallbacks")
+                await page.wait_for_load_state("domcontentloaded", timeout=15000)
             
-            # Fast product name extraction
-            product_name = None
-            name_selectors = [
-                "h1",  # Start with most common first
-                "h1[data-testid='pdp-product-title']",
-                ".pdp-product-title",
-                "h1.pdp-title",
-                ".product-title h1",
-                ".product-name h1"
-            ]
-            
-            for selector in name_selectors:
-                try:
-                    element = await page.query_selector(selector)
-                    if element:
-                        product_name = (await element.inner_text()).strip()
-                        if product_name:  # Only break if we got actual text
-                            logger.info(f"Found product name: {product_name}")
-                            break
-                except:
-                    continue
+            # Probe every selector list inside the page in a single round trip
+            logger.info("Looking for product name and price selectors...")
+            dom = await page.evaluate(
+                _EXTRACT_DOM_JS,
+                [
+                    _winner_first(self._winning_name_selector, _NAME_SELECTORS),
+                    _winner_first(self._winning_sale_selector, _SALE_SELECTORS),
+                    _winner_first(self._winning_orig_selector, _ORIG_SELECTORS),
+                    _PRICE_SELECTORS
+                ]
+            )
+            self._winning_name_selector = dom["nameSelector"] or self._winning_name_selector
+            self._winning_sale_selector = dom["saleSelector"] or self._winning_sale_selector
+            self._winning_orig_selector = dom["originalSelector"] or self._winning_orig_selector
             
-            # Fast price extraction - detect both sale price and original price
-            sale_price_text = None
-            original_price_text = None
-            detected_currency = None
-            page_content = await page.content()
+            # Structured data rendered client-side, or withheld from the plain HTTP fetch, beats selector guesses
+            result = _first_json_ld_product(dom["jsonLd"])
+            if result:
+                _fill_original_price(result, self.extract_price_and_currency(dom["original"])[0])
+                logger.info("Scraping result (JSON-LD): %s", result)
+                return result
             
-            # First, try to find sale price using specific selectors
-            logger.info("Looking for sale price selectors...")
-            sale_price_selectors = [
-                ".sale-price", ".current-price", ".discounted-price", ".final-price",
-                ".price-sale", ".price-current", ".price-now", ".price-final",
-                "[data-testid='sale-price']", "[data-testid='current-price']",
-                ".price.sale", ".price.current", ".price.discounted",
-                ".product-price-sale", ".product-price-current",
-                "span[class*='sale-price']", "span[class*='current-price']",
-                "div[class*='sale-price']", "div[class*='current-price']"
-            ]
+            product_name = dom["name"]
+            if product_name:
+                logger.info("Found product name: %s", product_name)
             
-            for selector in sale_price_selectors:
-                try:
-                    elements = await page.query_selector_all(selector)
-                    for element in elements[:2]:  # Check first 2 matches only
-                        text = await element.inner_text()
-                        if text and any(symbol in text for symbol in ['£', '$', '€']):
-                            sale_price_text = text.strip()
-                            detected_currency = self.extract_currency(sale_price_text)
-                            logger.info(f"Found SALE price with selector '{selector}': {sale_price_text}")
-                            break
-                    if sale_price_text:
-                        break
-                except:
-                    continue
+            # Fast price extraction - detect both sale price and original price
+            sale_price_text = dom["sale"]
+            original_price_text = dom["original"]
             
-            # Look for original price selectors (crossed out, struck through, etc.)
-            logger.info("Looking for original price selectors...")
-            original_price_selectors = [
-                ".original-price", ".was-price", ".strike-through", ".crossed-out",
-                ".price-was", ".price-original", ".price-before", ".regular-price",
-                "[data-testid='original-price']", "[data-testid='was-price']",
-                ".price.original", ".price.was", ".price.before",
-                "span[class*='original-price']", "span[class*='was-price']",
-                "div[class*='original-price']", "div[class*='was-price']",
-                "del", "s", ".strikethrough", "[style*='text-decoration: line-through']"
-            ]
+            if sale_price_text:
+                logger.info("Found SALE price with selector: %s", sale_price_text)
+            if original_price_text:
+                logger.info("Found ORIGINAL price with selector: %s", original_price_text)
             
-            for selector in original_price_selectors:
-                try:
-                    elements = await page.query_selector_all(selector)
-                    for element in elements[:2]:  # Check first 2 matches only
-                        text = await element.inner_text()
-                        if text and any(symbol in text for symbol in ['£', '$', '€']):
-                            original_price_text = text.strip()
-                            logger.info(f"Found ORIGINAL price with selector '{selector}': {original_price_text}")
-                            break
-                    if original_price_text:
-                        break
-                except:
-                    continue
+            # The serialized HTML is only needed by the text-pattern fallbacks below
+            page_content = None
+            # Price texts the scans below have already parsed, so they aren't parsed again at the end
+            known_prices = {}
+            if not sale_price_text or not original_price_text:
+                # The selectors may have matched before parsing finished; the fallbacks need the parsed document
+                await page.wait_for_load_state("domcontentloaded", timeout=15000)
+                # Serialize just the price blocks; the whole document only if they hold no prices
+                blocks = await page.evaluate(_PRICE_BLOCKS_JS, [_HTML_PRICE_SELECTOR, _MAX_PRICE_BLOCKS])
+                page_content = "\n".join(blocks)
+                # One sweep over the HTML; every text fallback below indexes into these lists
+                starts, ends, texts, values, struck = _price_hits(page_content)
+                if not texts:
+                    page_content = await page.content()
+                    starts, ends, texts, values, struck = _price_hits(page_content)
+                # The text between each hit and its neighbours (or the page edges)
+                gap_starts = [0] + ends[:-1]
+                gap_ends = starts[1:] + [len(page_content)]
+                known_prices.update(zip(texts, values))
             
             # Advanced price detection focusing on product area
             if not sale_price_text or not original_price_text:
@@ -151,38 +589,28 @@ class PaulSmithScraper:
                 # Try to find prices near the product name or in product context
                 product_name_lower = product_name.lower() if product_name else ""
                 
-                # Look for price patterns within a reasonable distance of product-related content
-                product_context_patterns = [
-                    # Prices near product, price, or sale keywords with limited character distance
-                    rf'(?i)(?:.{{0,200}}(?:price|cost|£|$|€).{{0,50}}([£$€]\d{{1,3}}(?:,\d{{3}})*\.?\d{{0,2}}))',
-                    rf'(?i)(?:([£$€]\d{{1,3}}(?:,\d{{3}})*\.?\d{{0,2}}).{{0,50}}(?:price|cost))',
-                    # Look for consecutive prices (often sale + original)
-                    rf'([£$€]\d{{1,3}}(?:,\d{{3}})*\.?\d{{0,2}}).{{0,100}}([£$€]\d{{1,3}}(?:,\d{{3}})*\.?\d{{0,2}})',
-                ]
-                
-                found_price_pairs = []
-                for pattern in product_context_patterns:
-                    matches = re.findall(pattern, page_content, re.IGNORECASE | re.DOTALL)
-                    for match in matches:
-                        if isinstance(match, tuple) and len(match) == 2:
-                            # Two prices found together
-                            price1 = self.extract_price(match[0])
-                            price2 = self.extract_price(match[1])
-                            if price1 and price2 and price1 != price2 and 1 <= min(price1, price2) <= 1000:
-                                found_price_pairs.append((match[0], price1, match[1], price2))
-                                logger.info(f"Found price pair: {match[0]} and {match[1]}")
-                        elif isinstance(match, str):
-                            # Single price found
-                            price = self.extract_price(match)
-                            if price and 1 <= price <= 1000:
-                                if not sale_price_text:
-                                    sale_price_text = match
-                                    detected_currency = self.extract_currency(match)
-                                    logger.info(f"Found single price in context: {match}")
+                # Both results below only fill a missing sale price, so skip the scan if we have one
+                first_pair = None
+                for index in ([] if sale_price_text else range(len(texts))):
+                    price = values[index]
+                    
+                    # Single price with a price/cost keyword nearby; a struck price is never the sale price
+                    if not struck[index] and 1 <= price <= 1000 and _keyword_in_text(
+                            _PRICE_KEYWORD_RE, page_content, max(0, starts[index] - 200), ends[index] + 50):
+                        sale_price_text = texts[index]
+                        logger.info("Found single price in context: %s", sale_price_text)
+                        break
+                    
+                    # Two prices close together (often sale + original); only the first is ever used
+                    if first_pair is None and index + 1 < len(texts) and starts[index + 1] - ends[index] <= 100:
+                        next_price = values[index + 1]
+                        if price != next_price and 1 <= min(price, next_price) <= 1000:
+                            first_pair = (texts[index], price, texts[index + 1], next_price)
+                            logger.info("Found price pair: %s and %s", texts[index], texts[index + 1])
                 
-                # If we found price pairs, use the first pair (assuming it's for this product)
-                if found_price_pairs and not sale_price_text:
-                    pair = found_price_pairs[0]
+                # If we found a price pair, use it (assuming it's for this product)
+                if first_pair and not sale_price_text:
+                    pair = first_pair
                     price1_val, price2_val = pair[1], pair[3]
                     
                     # Use lower price as sale price, higher as original
@@ -193,125 +621,86 @@ class PaulSmithScraper:
                         sale_price_text = pair[2]
                         original_price_text = pair[0]
                     
-                    detected_currency = self.extract_currency(sale_price_text)
-                    logger.info(f"Using price pair - Sale: {sale_price_text}, Original: {original_price_text}")
+                    logger.info("Using price pair - Sale: %s, Original: %s", sale_price_text, original_price_text)
             
             # Fallback: Look for sale price patterns in context
             if not sale_price_text:
                 logger.info("Looking for sale prices in page content...")
                 
-                # Look for sale price patterns in context
-                sale_context_patterns = [
-                    r'(?:sale|now|discounted?|reduced?|special|offer)[^£$€]*([£$€]\d{1,3}(?:,\d{3})*\.?\d{0,2})',
-                    r'([£$€]\d{1,3}(?:,\d{3})*\.?\d{0,2})[^£$€]*(?:sale|now|discounted?|reduced?)',
-                ]
-                
-                for pattern in sale_context_patterns:
-                    matches = re.findall(pattern, page_content, re.IGNORECASE)
-                    if matches:
-                        sale_price_text = matches[0]
-                        detected_currency = self.extract_currency(sale_price_text)
-                        logger.info(f"Found SALE price with context pattern: {sale_price_text}")
-                        break
+                # A sale keyword just before a price, else just after it
+                sale_price_text = (
+                    _first_hit_with_keyword(_SALE_BEFORE_RE, page_content, texts, gap_starts, starts)
+                    or _first_hit_with_keyword(_SALE_AFTER_RE, page_content, texts, ends, gap_ends)
+                )
+                if sale_price_text:
+                    logger.info("Found SALE price with context pattern: %s", sale_price_text)
             
             # Fallback: Look for original price patterns in context (was, originally, etc.)
             if not original_price_text:
                 logger.info("Looking for original prices in page content...")
                 
-                # Look for original price patterns in context
-                original_context_patterns = [
-                    r'(?:was|originally|before|regular|rrp)[^£$€]*([£$€]\d{1,3}(?:,\d{3})*\.?\d{0,2})',
-                    r'([£$€]\d{1,3}(?:,\d{3})*\.?\d{0,2})[^£$€]*(?:was|originally|before|regular|rrp)',
-                    r'<del[^>]*>.*?([£$€]\d{1,3}(?:,\d{3})*\.?\d{0,2}).*?</del>',  # Strikethrough tags
-                    r'<s[^>]*>.*?([£$€]\d{1,3}(?:,\d{3})*\.?\d{0,2}).*?</s>',      # Strikethrough tags
-                ]
-                
-                for pattern in original_context_patterns:
-                    matches = re.findall(pattern, page_content, re.IGNORECASE | re.DOTALL)
-                    if matches:
-                        original_price_text = matches[0]
-                        logger.info(f"Found ORIGINAL price with context pattern: {original_price_text}")
-                        break
+                # A was/rrp keyword just before or after a price, else a struck-through price;
+                # never the hit already taken as the sale price
+                original_price_text = (
+                    _first_hit_with_keyword(_ORIGINAL_KEYWORD_RE, page_content, texts, gap_starts, starts, sale_price_text)
+                    or _first_hit_with_keyword(_ORIGINAL_KEYWORD_RE, page_content, texts, ends, gap_ends, sale_price_text)
+                    or next((text for text, is_struck in zip(texts, struck) if is_struck and text != sale_price_text), None)
+                )
+                if original_price_text:
+                    logger.info("Found ORIGINAL price with context pattern: %s", original_price_text)
             
             # If still no prices found, fall back to general price patterns
             if not sale_price_text and not original_price_text:
                 logger.info("No specific prices found, looking for general prices...")
                 
-                # Look for price patterns with currency symbols
-                currency_patterns = [
-                    (r'\$(\d{1,3}(?:,\d{3})*\.?\d{0,2})', '$', 'USD'),  # $313.00
-                    (r'£(\d{1,3}(?:,\d{3})*\.?\d{0,2})', '£', 'GBP'),   # £140.00
-                    (r'€(\d{1,3}(?:,\d{3})*\.?\d{0,2})', '€', 'EUR'),   # €38.00
-                ]
-                
+                # Scan the rendered text in the browser so only the matched prices cross CDP
                 found_prices = []
-                for pattern, symbol, currency in currency_patterns:
-                    matches = re.findall(pattern, page_content)
-                    if matches:
-                        for match in matches:
-                            found_prices.append((f"{symbol}{match}", currency, float(match.replace(',', ''))))
+                for match in await page.evaluate(_PAGE_PRICES_JS, _MAX_PAGE_PRICES):
+                    symbol, number = match[0], match[1:].strip()
+                    found_prices.append((f"{symbol}{number}", _CURRENCY_BY_SYMBOL[symbol], float(number.replace(',', ''))))
+                known_prices.update((price_str, value) for price_str, _, value in found_prices)
                 
                 # Choose prices from found matches
                 if found_prices:
-                    # Remove duplicates and sort by frequency and context
-                    unique_prices = {}
+                    # Remove duplicates, keeping the first text seen and how often each price occurs
+                    frequency = Counter((value, currency) for _, currency, value in found_prices)
+                    first_text = {}
                     for price_str, currency, value in found_prices:
-                        key = (value, currency)
-                        if key not in unique_prices:
-                            unique_prices[key] = []
-                        unique_prices[key].append(price_str)
+                        first_text.setdefault((value, currency), price_str)
                     
-                    # Convert back to list and sort by frequency, then by value
-                    price_candidates = [(value, currency, texts[0], len(texts)) for (value, currency), texts in unique_prices.items()]
+                    price_candidates = [(value, currency, first_text[value, currency], count) for (value, currency), count in frequency.items()]
                     
                     # If we have multiple prices, assign lowest as sale price and highest as original
                     if len(price_candidates) > 1:
                         price_candidates.sort(key=lambda x: x[0])  # Sort by value (lowest first)
                         sale_price_text = price_candidates[0][2]  # Lowest price (likely sale)
                         original_price_text = price_candidates[-1][2]  # Highest price (likely original)
-                        detected_currency = price_candidates[0][1]
-                        logger.info(f"Multiple prices found - Sale: {sale_price_text}, Original: {original_price_text}")
+                        logger.info("Multiple prices found - Sale: %s, Original: %s", sale_price_text, original_price_text)
                     else:
                         # Only one price found, use it as the current price
                         sale_price_text = price_candidates[0][2]
-                        detected_currency = price_candidates[0][1]
-                        logger.info(f"Single price found: {sale_price_text}")
+                        logger.info("Single price found: %s", sale_price_text)
                     
-                    logger.info(f"All found prices: {[(f'{p[2]} {p[1]}', f'freq:{p[3]}') for p in price_candidates]}")  # Show all with frequency
+                    if logger.isEnabledFor(logging.INFO):  # Show all with frequency
+                        logger.info("All found prices: %s", [(f'{p[2]} {p[1]}', f'freq:{p[3]}') for p in price_candidates])
             
             # Final fallback to general DOM selectors
-            if not sale_price_text:
-                logger.info("Trying general DOM price selectors...")
-                price_selectors = [
-                    ".price", ".current-price", ".product-price", 
-                    "[data-testid='price']", "span[class*='price']",
-                    ".price-current", ".price-now"
-                ]
-                
-                for selector in price_selectors:
-                    try:
-                        elements = await page.query_selector_all(selector)
-                        for element in elements[:3]:  # Check first 3 matches only
-                            text = await element.inner_text()
-                            if text and any(symbol in text for symbol in ['£', '$', '€']):
-                                sale_price_text = text.strip()
-                                detected_currency = self.extract_currency(sale_price_text)
-                                logger.info(f"Found price with general selector: {sale_price_text}")
-                                break
-                        if sale_price_text:
-                            break
-                    except:
-                        continue
-            
-            await page.close()
+            if not sale_price_text and dom["fallback"]:
+                sale_price_text = dom["fallback"]
+                logger.info("Found price with general selector: %s", sale_price_text)
             
             if not product_name:
                 logger.error("Could not find product name")
                 return None
             
-            # Extract numeric prices from text
-            current_price = self.extract_price(sale_price_text) if sale_price_text else None
-            original_price = self.extract_price(original_price_text) if original_price_text else None
+            # Extract numeric prices and their currency; scanned texts all start with their symbol
+            def parse_price(price_text):
+                if price_text in known_prices:
+                    return known_prices[price_text], _CURRENCY_BY_SYMBOL[price_text[0]]
+                return self.extract_price_and_currency(price_text)
+            
+            current_price, sale_currency = parse_price(sale_price_text)
+            original_price, original_currency = parse_price(original_price_text)
             
             # If we have both prices but current is higher than original, swap them
             if current_price and original_price and current_price > original_price:
@@ -323,10 +712,8 @@ class PaulSmithScraper:
                 current_price = original_price
                 original_price = None
             
-            # Use detected currency if available, otherwise fall back to extraction
-            final_currency = detected_currency if detected_currency else (
-                self.extract_currency(sale_price_text or original_price_text) if (sale_price_text or original_price_text) else "GBP"
-            )
+            # Currency of the sale price if available, otherwise the original price
+            final_currency = sale_currency or original_currency or "GBP"
             
             result = {
                 "name": product_name,
@@ -335,92 +722,116 @@ class PaulSmithScraper:
                 "currency": final_currency
             }
             
-            logger.info(f"Scraping result: {result}")
+            logger.info("Scraping result: %s", result)
             return result
                 
         except Exception as e:
-            logger.error(f"Error scraping {url}: {str(e)}")
+            logger.error("Error scraping %s: %s", url, e)
             return None
+        finally:
+            if page:
+                await self._release_page(page, pool)
+
+    async def scrape_many(self, urls: List[str]) -> List[Optional[Dict[str, str]]]:
+        """Scrape several URLs concurrently, returning results in input order"""
+        return await asyncio.gather(*[self.scrape_product(url) for url in urls])
 
     async def close(self):
         """Close browser and cleanup resources"""
+        if self._http:
+            await self._http.aclose()
+            self._http = None
         if self.context:
+            # A persistent context owns its browser, so closing it shuts Chromium down
             await self.context.close()
-        if self.browser:
-            await self.browser.close()
-        if hasattr(self, 'playwright'):
-            await self.playwright.stop()
+        await self._stop_playwright()
+        self.context = None
+        self._retire_pool()
+        if self._owns_profile:
+            # Nothing else can reuse a per-process profile, so don't leave it behind in the temp dir
+            shutil.rmtree(self.user_data_dir, ignore_errors=True)
     
     def extract_price(self, price_text: str) -> Optional[float]:
         """Extract numeric price from price text"""
+        return self.extract_price_and_currency(price_text)[0]
+    
+    def extract_price_and_currency(self, price_text: str) -> Tuple[Optional[float], Optional[str]]:
+        """Extract numeric price and, if it carries a symbol, its currency from price text"""
         if not price_text:
-            return None
+            return None, None
             
-        logger.info(f"Extracting price from: '{price_text[:200]}...'")  # Truncate long text for logging
-        
-        # Find price patterns with currency symbols (most reliable)
-        currency_patterns = [
-            r'\$(\d{1,3}(?:,\d{3})*\.?\d{0,2})', # $1,234.56 or $1234.56
-            r'£(\d{1,3}(?:,\d{3})*\.?\d{0,2})',  # £1,234.56 or £1234.56
-            r'€(\d{1,3}(?:,\d{3})*\.?\d{0,2})',  # €1,234.56 or €1234.56
-        ]
+        logger.info("Extracting price from: '%.200s...'", price_text)  # Truncate long text for logging
         
-        # Try currency patterns first (most reliable)
-        for pattern in currency_patterns:
-            matches = re.findall(pattern, price_text)
-            if matches:
-                price_str = matches[0]  # Take the first match
-                try:
-                    # Remove comma thousands separators
-                    price_str = price_str.replace(',', '')
-                    price = float(price_str)
-                    logger.info(f"Extracted price with currency: {price}")
-                    return price
-                except ValueError as e:
-                    logger.warning(f"Could not convert '{price_str}' to float: {e}")
-                    continue
+        # A currency-prefixed number is most reliable; otherwise take the first sane number
+        match = _SYMBOL_PRICE_RE.search(price_text)
+        currency = _CURRENCY_BY_SYMBOL[match.group("sym")] if match else None
+        if not match:
+            match = _PRICE_COMBINED.search(price_text)
+        if not match:
+            logger.warning("No valid price found in text")
+            return None, None
         
-        # Fallback to number-only patterns
-        number_patterns = [
-            r'(\d{1,3}(?:,\d{3})*\.\d{2})',   # 1,234.56 (must have 2 decimal places)
-            r'(\d{3,}\.?\d{0,2})',            # 123.45 or 123 (at least 3 digits)
-            r'(\d+,\d{2})'                    # European format 123,45
-        ]
+        price = _parse_number(match.group("num"))
         
-        for pattern in number_patterns:
-            matches = re.findall(pattern, price_text)
-            if matches:
-                price_str = matches[0]
-                try:
-                    # Handle European comma decimal separator
-                    if ',' in price_str and '.' not in price_str and len(price_str.split(',')[1]) == 2:
-                        price_str = price_str.replace(',', '.')
-                    else:
-                        # Remove comma thousands separators
-                        price_str = price_str.replace(',', '')
-                    
-                    price = float(price_str)
-                    # Only accept reasonable prices (between $1 and $10,000)
-                    if 1 <= price <= 10000:
-                        logger.info(f"Extracted price: {price}")
-                        return price
-                except ValueError as e:
-                    logger.warning(f"Could not convert '{price_str}' to float: {e}")
-                    continue
+        # Only accept reasonable bare numbers (between $1 and $10,000)
+        if not currency and not 1 <= price <= 10000:
+            logger.warning("No valid price found in text")
+            return None, None
         
-        logger.warning(f"No valid price found in text")
-        return None
+        logger.info("Extracted price: %s", price)
+        return price, currency
     
     def extract_currency(self, price_text: str) -> str:
         """Extract currency from price text"""
-        if not price_text:
-            return "GBP"
-            
-        if "£" in price_text:
-            return "GBP"
-        elif "$" in price_text:
-            return "USD"
-        elif "€" in price_text:
-            return "EUR"
-        else:
-            return "GBP"  # Default for Paul Smith
\ No newline at end of file
+        match = _HAS_CUR(price_text) if price_text else None
+        # Default for Paul Smith
+        return _CURRENCY_BY_SYMBOL[match.group()] if match else "GBP"
+
+class BatchScraper:
+    """Coalesce scrape requests that arrive within a short window into one scrape_many call"""
+    
+    def __init__(self, scraper: PaulSmithScraper, window: float = 0.01):
+        self.scraper = scraper
+        self.window = window
+        self._queue = asyncio.Queue()
+        self._worker = None
+        self._batches = set()
+    
+    async def scrape(self, url: str) -> Optional[Dict[str, str]]:
+        """Queue a URL for the next batch and wait for its result"""
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._collect())
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((url, future))
+        return await future
+    
+    async def _collect(self):
+        while True:
+            batch = [await self._queue.get()]
+            await asyncio.sleep(self.window)
+            while not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            # Run each batch in the background so requests arriving meanwhile start the next one
+            task = asyncio.create_task(self._run_batch(batch))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+    
+    async def _run_batch(self, batch):
+        # Identical URLs in one window share a single scrape
+        urls = list(dict.fromkeys(url for url, _ in batch))
+        try:
+            results = dict(zip(urls, await self.scraper.scrape_many(urls)))
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for url, future in batch:
+            if not future.done():
+                future.set_result(results[url])
+    
+    async def close(self):
+        """Stop collecting requests; the underlying scraper is closed separately"""
+        if self._worker:
+            self._worker.cancel()
+            self._worker = None
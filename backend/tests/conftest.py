@@ -0,0 +1,17 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+
+# The backend modules import each other by bare name, as they do when run from backend/
+sys.path.insert(0, str(BACKEND_DIR))
+
+@pytest.fixture
+def load_fixture():
+    """Read an HTML page from tests/fixtures"""
+    def load(name):
+        return (FIXTURES_DIR / name).read_text(encoding="utf-8")
+    return load
@@ -0,0 +1,99 @@
+import pytest
+from fastapi.testclient import TestClient
+from fastapi_cache.backends.inmemory import InMemoryBackend
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from starlette.requests import Request
+
+import main
+from scraper import BatchScraper
+
+SHIRT_URL = "https://www.paulsmith.com/uk/shirt"
+COAT_URL = "https://www.paulsmith.com/uk/coat"
+
+@pytest.fixture
+def api(monkeypatch, tmp_path):
+    """A client against a fresh database, with scrapes answered from the returned dict of URL -> result"""
+    # Each test gets its own database file instead of the app's price_tracker.db
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'price_tracker.db'}")
+    monkeypatch.setattr(main, "engine", engine)
+    monkeypatch.setattr(main, "SessionLocal", async_sessionmaker(engine, autoflush=False, expire_on_commit=False))
+    results = {}
+
+    async def scrape_many(urls):
+        return [results.get(url) for url in urls]
+
+    async def noop():
+        pass
+
+    monkeypatch.setattr(main.scraper, "scrape_many", scrape_many)
+    monkeypatch.setattr(main.scraper, "_ensure_browser", noop)
+    monkeypatch.setattr(main.scraper, "close", noop)
+    # InMemoryBackend keeps its entries on the class, so they would outlive the test
+    monkeypatch.setattr(InMemoryBackend, "_store", {})
+    # Each TestClient runs its own event loop, which the batcher's queue is bound to
+    monkeypatch.setattr(main, "batcher", BatchScraper(main.scraper))
+    with TestClient(main.app) as client:
+        yield client, results
+
+def product(price, original_price=None, name="Shirt"):
+    return {"name": name, "price": price, "original_price": original_price, "currency": "GBP"}
+
+def make_request(path, query=b""):
+    return Request({"type": "http", "method": "GET", "path": path, "query_string": query, "headers": []})
+
+def test_cache_key_depends_only_on_path_and_query(api):
+    key = main.request_key_builder(
+        main.get_products, namespace="products", request=make_request("/products"),
+        kwargs={"db": object()}
+    )
+    same = main.request_key_builder(
+        main.get_products, namespace="products", request=make_request("/products"),
+        kwargs={"db": object()}
+    )
+    other = main.request_key_builder(
+        main.get_products, namespace="products", request=make_request("/products", b"skip=10")
+    )
+    assert key == same == "price-tracker:products:/products?"
+    assert other == "price-tracker:products:/products?skip=10"
+
+def test_add_product_stores_the_scraped_prices(api):
+    client, results = api
+    results[SHIRT_URL] = product(95.0, 140.0)
+    response = client.post("/products", json={"url": SHIRT_URL})
+    assert response.status_code == 200
+    assert client.post("/products", json={"url": SHIRT_URL}).status_code == 400
+
+    [row] = client.get("/products").json()
+    assert (row["name"], row["current_price"], row["original_price"]) == ("Shirt", 95.0, 140.0)
+
+def test_add_product_rejects_pages_that_cannot_be_scraped(api):
+    client, _ = api
+    response = client.post("/products", json={"url": SHIRT_URL})
+    assert response.status_code == 400
+    assert client.get("/products").json() == []
+
+def test_check_all_updates_scraped_products_and_reports_failures(api):
+    client, results = api
+    results[SHIRT_URL] = product(95.0, 140.0)
+    results[COAT_URL] = product(1450.0, name="Coat")
+    shirt_id = client.post("/products", json={"url": SHIRT_URL}).json()["id"]
+    coat_id = client.post("/products", json={"url": COAT_URL}).json()["id"]
+    # Populate the cache so the check has to clear it
+    assert len(client.get("/products").json()) == 2
+
+    results[SHIRT_URL] = product(80.0, 140.0)
+    results[COAT_URL] = None
+    response = client.post("/products/check-all").json()
+    assert response == {
+        "updated": [{
+            "product_id": shirt_id, "new_price": 80.0, "original_price": 140.0,
+            "name": "Shirt", "currency": "GBP"
+        }],
+        "failed": [coat_id],
+    }
+
+    prices = {row["id"]: row["current_price"] for row in client.get("/products").json()}
+    assert prices == {shirt_id: 80.0, coat_id: 1450.0}
+    history = client.get(f"/products/{shirt_id}/history").json()
+    assert sorted(entry["price"] for entry in history) == [80.0, 95.0]
+    assert len(client.get(f"/products/{coat_id}/history").json()) == 1
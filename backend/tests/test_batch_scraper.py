@@ -0,0 +1,48 @@
+import asyncio
+
+from scraper import BatchScraper
+
+class FakeScraper:
+    def __init__(self, error=None):
+        self.calls = []
+        self.error = error
+
+    async def scrape_many(self, urls):
+        self.calls.append(urls)
+        if self.error:
+            raise self.error
+        return [{"url": url} for url in urls]
+
+def run_with_batcher(scraper, scrapes):
+    async def run():
+        batcher = BatchScraper(scraper)
+        try:
+            return await scrapes(batcher)
+        finally:
+            await batcher.close()
+    return asyncio.run(run())
+
+def test_concurrent_requests_share_one_batch_and_duplicate_urls_one_scrape():
+    scraper = FakeScraper()
+    results = run_with_batcher(scraper, lambda batcher: asyncio.gather(
+        batcher.scrape("a"), batcher.scrape("b"), batcher.scrape("a")
+    ))
+    assert results == [{"url": "a"}, {"url": "b"}, {"url": "a"}]
+    assert scraper.calls == [["a", "b"]]
+
+def test_requests_after_the_window_start_a_new_batch():
+    scraper = FakeScraper()
+
+    async def one_after_another(batcher):
+        return [await batcher.scrape("a"), await batcher.scrape("b")]
+
+    assert run_with_batcher(scraper, one_after_another) == [{"url": "a"}, {"url": "b"}]
+    assert scraper.calls == [["a"], ["b"]]
+
+def test_failed_batch_fails_every_request_in_it():
+    scraper = FakeScraper(error=RuntimeError("browser crashed"))
+    results = run_with_batcher(scraper, lambda batcher: asyncio.gather(
+        batcher.scrape("a"), batcher.scrape("b"), return_exceptions=True
+    ))
+    assert [str(result) for result in results] == ["browser crashed", "browser crashed"]
+    assert all(isinstance(result, RuntimeError) for result in results)
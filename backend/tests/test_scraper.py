@@ -0,0 +1,207 @@
+import asyncio
+
+import httpx
+import pytest
+
+import scraper as scraper_module
+from scraper import (
+    PaulSmithScraper,
+    _first_hit_with_keyword,
+    _first_json_ld_product,
+    _is_domain_url,
+    _keyword_in_text,
+    _price_hits,
+    _ORIGINAL_KEYWORD_RE,
+    _PRICE_KEYWORD_RE,
+    _SALE_BEFORE_RE,
+)
+
+URL = "https://www.paulsmith.com/uk/mens-slim-fit-gingham-shirt"
+
+# Price sweep
+
+def test_price_hits_returns_positions_values_and_strike_flags():
+    html = '<div class="price">Now £95.00 <del>Was £1,140.00</del> <s>£120</s> €80</div>'
+    starts, ends, texts, values, struck = _price_hits(html)
+    assert texts == ["£95.00", "£1,140.00", "£120", "€80"]
+    assert [html[start:end] for start, end in zip(starts, ends)] == texts
+    assert values == [95.0, 1140.0, 120.0, 80.0]
+    assert struck == [False, True, True, False]
+
+def test_price_hits_does_not_treat_span_or_script_as_strike_tags():
+    _, _, texts, _, struck = _price_hits("<span>£10</span><script>x</script><strong>£20</strong>")
+    assert texts == ["£10", "£20"]
+    assert struck == [False, False]
+
+def test_first_hit_with_keyword_checks_the_gap_before_each_hit():
+    html = "<span>Now</span> £95.00 <span>Was</span> £140.00"
+    starts, ends, texts, _, _ = _price_hits(html)
+    gap_starts = [0] + ends[:-1]
+    assert _first_hit_with_keyword(_SALE_BEFORE_RE, html, texts, gap_starts, starts) == "£95.00"
+    assert _first_hit_with_keyword(_ORIGINAL_KEYWORD_RE, html, texts, gap_starts, starts) == "£140.00"
+
+def test_first_hit_with_keyword_skips_the_excluded_hit():
+    html = "Was £95.00 Was £140.00"
+    starts, ends, texts, _, _ = _price_hits(html)
+    gap_starts = [0] + ends[:-1]
+    assert _first_hit_with_keyword(_ORIGINAL_KEYWORD_RE, html, texts, gap_starts, starts, "£95.00") == "£140.00"
+
+def test_keyword_in_text_ignores_tag_attributes():
+    assert not _keyword_in_text(_PRICE_KEYWORD_RE, '<div class="price">£95.00</div>', 0, 31)
+    assert _keyword_in_text(_PRICE_KEYWORD_RE, '<div class="x">Price: £95.00</div>', 0, 34)
+
+# Text parsing and URL checks
+
+@pytest.mark.parametrize("text, expected", [
+    ("£95.00", (95.0, "GBP")),
+    ("Now $1,234.56", (1234.56, "USD")),
+    ("€123,45", (123.45, "EUR")),
+    ("£ 80", (80.0, "GBP")),
+    ("Price 80", (80.0, None)),
+    ("Item 99999", (None, None)),
+    ("Sold out", (None, None)),
+    ("", (None, None)),
+    (None, (None, None)),
+])
+def test_extract_price_and_currency(text, expected):
+    assert PaulSmithScraper().extract_price_and_currency(text) == expected
+
+@pytest.mark.parametrize("url, expected", [
+    ("https://www.paulsmith.com/uk/shirt", True),
+    ("https://paulsmith.com/uk/shirt", True),
+    ("https://PaulSmith.com/uk/shirt", True),
+    ("https://notpaulsmith.com/uk/shirt", False),
+    ("https://paulsmith.com.example.net/uk/shirt", False),
+    ("https://example.net/?next=paulsmith.com", False),
+    ("https://[::1/shirt", False),
+    ("not a url", False),
+])
+def test_is_domain_url(url, expected):
+    assert _is_domain_url(url, "paulsmith.com") is expected
+
+# JSON-LD
+
+def test_first_json_ld_product_skips_bad_and_non_product_blocks():
+    blocks = [
+        "{not json",
+        '{"@type": "BreadcrumbList"}',
+        '{"@graph": [{"@type": "WebPage"}, {"@type": ["Product"], "name": " Shirt ",'
+        ' "offers": [{"price": "95", "priceCurrency": "EUR", "priceSpecification":'
+        ' {"priceType": "https://schema.org/StrikethroughPrice", "price": "140"}}]}]}',
+    ]
+    assert _first_json_ld_product(blocks) == {
+        "name": "Shirt", "price": 95.0, "original_price": 140.0, "currency": "EUR"
+    }
+
+def test_first_json_ld_product_needs_name_and_price():
+    assert _first_json_ld_product(['{"@type": "Product", "name": "Shirt", "offers": {}}']) is None
+    assert _first_json_ld_product(['{"@type": "Product", "offers": {"price": "95"}}']) is None
+
+def test_json_ld_original_price_must_be_above_the_price():
+    block = ('{"@type": "Product", "name": "Shirt", "offers": {"price": "95", "priceSpecification":'
+             ' {"priceType": "ListPrice", "price": "95"}}}')
+    assert _first_json_ld_product([block])["original_price"] is None
+
+# Static-HTML fast path
+
+def fast_scrape(html, status_code=200):
+    async def run():
+        scraper = PaulSmithScraper()
+        scraper._http = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(status_code, text=html))
+        )
+        try:
+            return await scraper._fast_scrape(URL)
+        finally:
+            await scraper.close()
+    return asyncio.run(run())
+
+def test_fast_path_reads_sale_and_was_price_from_static_html(load_fixture):
+    assert fast_scrape(load_fixture("sale_page.html")) == {
+        "name": "Men's Slim Fit Gingham Shirt", "price": 95.0, "original_price": 140.0, "currency": "GBP"
+    }
+
+def test_fast_path_fills_json_ld_original_price_from_the_markup(load_fixture):
+    assert fast_scrape(load_fixture("was_price_page.html")) == {
+        "name": "Men's Wool Overcoat", "price": 1150.0, "original_price": 1450.0, "currency": "GBP"
+    }
+
+def test_fast_path_accepts_prices_over_1000():
+    result = fast_scrape('<h1>Wool Overcoat</h1><div class="price">£1,250.00</div>')
+    assert result["price"] == 1250.0
+
+def test_fast_path_gives_up_without_a_name_or_price():
+    assert fast_scrape('<div class="price">£95.00</div>') is None
+    assert fast_scrape("<h1>Shirt</h1><p>Sold out</p>") is None
+
+def test_fast_path_gives_up_on_http_errors(load_fixture):
+    assert fast_scrape(load_fixture("sale_page.html"), status_code=503) is None
+
+# Browser text fallbacks
+
+class FakePage:
+    def __init__(self, dom, blocks):
+        self.dom, self.blocks = dom, blocks
+
+    async def goto(self, *args, **kwargs):
+        pass
+
+    async def wait_for_function(self, *args, **kwargs):
+        pass
+
+    async def wait_for_load_state(self, *args, **kwargs):
+        pass
+
+    async def content(self):
+        return "".join(self.blocks)
+
+    async def evaluate(self, script, arg=None):
+        if script is scraper_module._EXTRACT_DOM_JS:
+            return self.dom
+        if script is scraper_module._PRICE_BLOCKS_JS:
+            return self.blocks
+        return []
+
+def browser_scrape(blocks, **dom):
+    async def run():
+        scraper = PaulSmithScraper()
+
+        async def no_fast_path(url):
+            return None
+
+        async def ready():
+            pass
+
+        async def release(page, pool):
+            pass
+
+        scraper._fast_scrape = no_fast_path
+        scraper._ensure_browser = ready
+        scraper._release_page = release
+        scraper._page_pool = asyncio.Queue()
+        scraper._page_pool.put_nowait(FakePage({
+            "name": "Shirt", "nameSelector": "h1", "sale": None, "saleSelector": None,
+            "original": None, "originalSelector": None, "fallback": None, "jsonLd": [], **dom
+        }, blocks))
+        return await scraper.scrape_product(URL)
+    return asyncio.run(run())
+
+def test_struck_price_is_not_taken_as_the_single_price_in_context():
+    result = browser_scrape(['<div class="price"><del>£140.00</del> £95.00</div>'])
+    assert (result["price"], result["original_price"]) == (95.0, 140.0)
+
+def test_price_keyword_in_text_picks_the_single_price():
+    result = browser_scrape(['<div class="x"><p>Price: £95.00</p></div><del>£140.00</del>'])
+    assert (result["price"], result["original_price"]) == (95.0, 140.0)
+
+def test_lone_struck_price_becomes_the_current_price():
+    result = browser_scrape(['<div class="price"><del>£140.00</del></div>'])
+    assert (result["price"], result["original_price"]) == (140.0, None)
+
+def test_json_ld_result_takes_the_dom_original_price():
+    block = '{"@type": "Product", "name": "Shirt", "offers": {"price": "70", "priceCurrency": "GBP"}}'
+    assert browser_scrape([], original="£120.00", jsonLd=[block])["original_price"] == 120.0
+    assert browser_scrape([], original="£50.00", jsonLd=[block])["original_price"] is None
+
+def test_invalid_url_is_rejected_without_scraping():
+    assert asyncio.run(PaulSmithScraper().scrape_product("https://example.com/shirt")) is None
@@ -23,7 +23,8 @@ function App() {
 
   const fetchProducts = async () => {
     try {
-      const response = await fetch(`${API_BASE}/products`)
+      // Revalidate with the server's ETag rather than trusting the cached max-age after writes
+      const response = await fetch(`${API_BASE}/products`, { cache: 'no-cache' })
       if (response.ok) {
         const data = await response.json()
         setProducts(data)
@@ -7,22 +7,24 @@ This script sets up the development environment for both backend and frontend
 import subprocess
 import sys
 import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-def run_command(command, cwd=None, description=""):
+def run_command(command, cwd=None, description="", label=""):
     """Run a shell command and handle errors"""
-    print(f"Running: {description or command}")
-    try:
-        result = subprocess.run(command, shell=True, cwd=cwd, check=True, 
-                              capture_output=True, text=True)
-        if result.stdout:
-            print(result.stdout)
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"Error: {e}")
-        if e.stderr:
-            print(f"Error output: {e.stderr}")
+    # Backend and frontend setup run in parallel, so every line says which one it came from
+    prefix = f"[{label}] " if label else ""
+    print(f"{prefix}Running: {description or command}")
+    # Stream output as it arrives instead of buffering all of it until the command exits
+    with subprocess.Popen(command, shell=True, cwd=cwd, stdout=subprocess.PIPE,
+                          stderr=subprocess.STDOUT, text=True, bufsize=1) as proc:
+        for line in proc.stdout:
+            print(f"{prefix}{line}", end="")
+    if proc.returncode != 0:
+        print(f"{prefix}Error: Command '{command}' returned non-zero exit status {proc.returncode}.")
         return False
+    return True
 
 def setup_backend():
     """Set up the backend environment"""
@@ -36,7 +38,7 @@ def setup_backend():
     # Create virtual environment if it doesn't exist
     venv_dir = backend_dir / "venv"
     if not venv_dir.exists():
-        if not run_command("python -m venv backend/venv", description="Creating virtual environment"):
+        if not run_command("python -m venv backend/venv", description="Creating virtual environment", label="backend"):
             return False
     
     # Install requirements
@@ -47,13 +49,18 @@ def setup_backend():
         pip_path = "backend/venv/bin/pip"
         python_path = "backend/venv/bin/python"
     
-    if not run_command(f"{pip_path} install -r backend/requirements.txt", 
-                      description="Installing Python dependencies"):
+    # uv resolves and installs far faster than pip; fall back to the venv's pip without it
+    if shutil.which("uv"):
+        install_command = f"uv pip install --python {python_path} -r backend/requirements.txt"
+    else:
+        install_command = f"{pip_path} install -r backend/requirements.txt"
+    if not run_command(install_command, 
+                      description="Installing Python dependencies", label="backend"):
         return False
     
     # Install Playwright browsers
     if not run_command(f"{python_path} -m playwright install", 
-                      description="Installing Playwright browsers"):
+                      description="Installing Playwright browsers", label="backend"):
         return False
     
     print("✅ Backend setup complete!")
@@ -70,7 +77,7 @@ def setup_frontend():
     
     # Install npm dependencies
     if not run_command("npm install", cwd="frontend", 
-                      description="Installing Node.js dependencies"):
+                      description="Installing Node.js dependencies", label="frontend"):
         return False
     
     print("✅ Frontend setup complete!")
@@ -86,13 +93,17 @@ def main():
         print("   Expected structure: project_root/backend and project_root/frontend")
         sys.exit(1)
     
-    # Setup backend
-    if not setup_backend():
+    # Backend and frontend installs are independent, so run them side by side
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        backend = executor.submit(setup_backend)
+        frontend = executor.submit(setup_frontend)
+        backend_ok, frontend_ok = backend.result(), frontend.result()
+    
+    if not backend_ok:
         print("❌ Backend setup failed!")
         sys.exit(1)
     
-    # Setup frontend
-    if not setup_frontend():
+    if not frontend_ok:
         print("❌ Frontend setup failed!")
         sys.exit(1)
     